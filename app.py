@@ -2,11 +2,24 @@
 # Install required libraries: pip install streamlit yt-dlp
 
 import streamlit as st
-from transformers import pipline
 import yt_dlp
-import os
+import queue
 import re
+import subprocess
+import tempfile
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import partial
 from pathlib import Path
+from typing import NamedTuple, Optional
+from yt_dlp.networking.exceptions import HTTPError, TransportError
+from yt_dlp.utils import (
+    DownloadError,
+    ExtractorError,
+    GeoRestrictedError,
+    UnavailableVideoError,
+    remove_terminal_sequences,
+)
 
 # Configure page
 st.set_page_config(
@@ -15,6 +28,66 @@ st.set_page_config(
     layout="centered"
 )
 
+# Number of videos converted in parallel in batch mode
+MAX_WORKERS = 4
+
+# Longest a single ffmpeg conversion may run, in seconds
+FFMPEG_TIMEOUT = 900
+
+# The only yt-dlp extractors this app needs. youtu.be share links with a
+# ?list= are handled by the youtu.be extractor, which is named
+# 'youtubeytbe' in older yt-dlp releases and 'youtube:ytbe' in newer ones.
+YOUTUBE_EXTRACTORS = ['youtube', 'youtube:tab', 'youtube:ytbe', 'youtubeytbe']
+
+# Pre-compiled patterns used by clean_filename and validate_youtube_url
+_CLEAN_SPECIAL = re.compile(r'[^\w\s-]')
+_CLEAN_WS = re.compile(r'\s+')
+# Common YouTube URL patterns: watch?v=, youtu.be/, embed/ and v/
+_YT_PATTERN = re.compile(r'youtube\.com/(?:watch\?v=|embed/|v/)[\w-]+|youtu\.be/[\w-]+')
+
+# Options for the lightweight info lookup shown before converting. Entries
+# inside playlists are left unresolved; download_youtube_audio resolves
+# whatever is still missing as part of the download itself.
+_PREFLIGHT_OPTS = {
+    'quiet': True,
+    'no_warnings': True,
+    'skip_download': True,
+    'extract_flat': 'in_playlist',
+    'noplaylist': True,  # Treat watch?v=...&list=... as the single video
+    'socket_timeout': 10,
+    'allowed_extractors': YOUTUBE_EXTRACTORS,
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+}
+
+# User-friendly messages for the yt-dlp errors we know how to explain
+ERROR_MESSAGES = {
+    # yt-dlp raises this when saving the download fails (e.g. disk full)
+    UnavailableVideoError: "❌ Error: Could not save the downloaded audio on the server. Please try again later.",
+    GeoRestrictedError: "❌ Error: Video not available in this region or on this platform.",
+    TransportError: "❌ Error: Network connection issue. Check your internet.",
+}
+HTTP_ERROR_MESSAGES = {
+    403: "❌ Error: Access forbidden. YouTube is blocking this request. Try updating yt-dlp or use a different video.",
+    429: "❌ Error: Too many requests. Please wait a few minutes and try again.",
+}
+
+class ConversionError(Exception):
+    """
+    Raised when ffmpeg cannot convert the downloaded audio.
+    """
+
+
+class ConvertResult(NamedTuple):
+    """
+    Outcome of a single download and conversion.
+    """
+    success: bool
+    message: str
+    filename: Optional[str] = None  # Name offered for the MP3 download
+    audio_bytes: Optional[bytes] = None  # Encoded MP3 audio
+    size: int = 0  # Size of the MP3 audio in bytes
+
+
 def clean_filename(filename):
     """
     Remove special characters from filename to avoid file system issues.
@@ -26,9 +99,9 @@ def clean_filename(filename):
         Cleaned filename safe for file systems
     """
     # Remove special characters, keep only alphanumeric, spaces, hyphens, underscores
-    cleaned = re.sub(r'[^\w\s-]', '', filename)
+    cleaned = _CLEAN_SPECIAL.sub('', filename)
     # Replace multiple spaces with single space
-    cleaned = re.sub(r'\s+', ' ', cleaned)
+    cleaned = _CLEAN_WS.sub(' ', cleaned)
     return cleaned.strip()
 
 def validate_youtube_url(url):
@@ -46,108 +119,302 @@ def validate_youtube_url(url):
         return False, "Not a YouTube URL"
     
     # Check for common YouTube URL patterns
-    patterns = [
-        r'youtube\.com/watch\?v=[\w-]+',
-        r'youtu\.be/[\w-]+',
-        r'youtube\.com/embed/[\w-]+',
-        r'youtube\.com/v/[\w-]+'
-    ]
-    
-    for pattern in patterns:
-        if re.search(pattern, url):
-            return True, "Valid"
+    if _YT_PATTERN.search(url):
+        return True, "Valid"
     
     return False, "Invalid YouTube URL format"
 
 
-def download_youtube_audio(url, output_path, quality='192'):
+@st.cache_resource(show_spinner=False)
+def get_downloads_dir():
     """
-    Download YouTube video and convert to MP3.
+    Create the downloads folder once per server process.
+    
+    Returns:
+        Path object of the downloads folder
+    """
+    downloads_path = Path("downloads")
+    downloads_path.mkdir(exist_ok=True)
+    return downloads_path
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def fetch_info(url):
+    """
+    Extract video info without downloading, cached per URL for an hour.
     
     Args:
         url: YouTube video URL
+    
+    Returns:
+        Sanitized info dict as returned by yt-dlp
+    """
+    with yt_dlp.YoutubeDL(_PREFLIGHT_OPTS) as ydl:
+        # Drop keys like requested_formats left by the preflight's own format
+        # selection, so the download pass selects formats from scratch
+        return ydl.sanitize_info(ydl.extract_info(url, download=False), remove_private_keys=True)
+
+
+def track_progress(progress, current_job, status):
+    """
+    yt-dlp progress hook that records how far the current job's download is.
+    
+    Args:
+        progress: Dict of job key to download progress (0.0 to 1.0)
+        current_job: Dict whose 'key' is the job using this YoutubeDL instance
+        status: Progress dict passed by yt-dlp
+    """
+    job_key = current_job.get('key')
+    if job_key is None:
+        return
+    
+    if status['status'] == 'downloading':
+        total = status.get('total_bytes') or status.get('total_bytes_estimate')
+        if total:
+            progress[job_key] = min(status.get('downloaded_bytes', 0) / total, 1.0)
+    elif status['status'] == 'finished':
+        progress[job_key] = 1.0
+
+
+def build_ydl_opts(output_path, quality):
+    """
+    Build the yt-dlp options used for downloading the source audio.
+    
+    Args:
         output_path: Path object where to save the file
         quality: Audio quality in kbps (128, 192, or 320)
     
     Returns:
-        Tuple of (success: bool, message: str, filepath: str or None)
+        Dict of yt-dlp options
+    """
+    # Prefer the best source that is not much above the target bitrate,
+    # so we don't download (and transcode down) more than the MP3 keeps
+    max_abr = int(int(quality) * 1.1)
+    
+    # Configure yt-dlp options with better bot detection avoidance
+    return {
+        'format': f'bestaudio[abr<={max_abr}]/bestaudio/best',
+        'outtmpl': str(output_path / '%(id)s.%(ext)s'),  # Output template
+        'allowed_extractors': YOUTUBE_EXTRACTORS,  # Skip matching against non-YouTube sites
+        'noplaylist': True,  # Only ever download the single video
+        'quiet': False,  # Show progress
+        'no_warnings': False,
+        # Additional options to avoid 403 errors
+        'nocheckcertificate': True,
+        'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'referer': 'https://www.youtube.com/',
+        'extractor_retries': 3,
+        'fragment_retries': 3,
+        'skip_unavailable_fragments': True,
+        # Download DASH fragments in parallel and fetch plain https
+        # streams in 10MB chunks to avoid YouTube throttling
+        'concurrent_fragment_downloads': 8,
+        'http_chunk_size': 10 * 1024 * 1024,
+        # Use cookies if available (helps with 403 errors)
+        'cookiefile': 'cookies.txt' if Path('cookies.txt').exists() else None,
+        # Additional options for restricted videos
+        'age_limit': None,  # Bypass age restrictions if possible
+        'geo_bypass': True,  # Try to bypass geographic restrictions
+        'geo_bypass_country': 'US',  # Pretend to be from US
+        # Optional: Add proxy if needed (uncomment and add your proxy)
+        # 'proxy': 'http://your-proxy-here:port',
+    }
+
+
+@st.cache_resource(show_spinner=False)
+def get_ydl_pool(output_path, quality):
+    """
+    Get a pool of long-lived YoutubeDL instances for the given output folder and quality.
+    
+    Streamlit keeps the instances alive across reruns so extractors, cookies
+    and the HTTP opener are only set up once. YoutubeDL is not thread-safe,
+    so each parallel download takes its own instance from the pool and puts
+    it back when done.
+    
+    Each instance reports download progress into the returned progress dict,
+    under the key of the job currently using it. The dict is cached together
+    with the pool, so every rerun and session polls the same one.
+    
+    Args:
+        output_path: Path object where to save the file
+        quality: Audio quality in kbps (128, 192, or 320)
+    
+    Returns:
+        Tuple of (pool: Queue of (YoutubeDL, current_job dict) pairs,
+        progress: dict of job key to download progress)
+    """
+    pool = queue.Queue()
+    progress = {}
+    for _ in range(MAX_WORKERS):
+        current_job = {}
+        ydl_opts = build_ydl_opts(output_path, quality)
+        ydl_opts['progress_hooks'] = [partial(track_progress, progress, current_job)]  # Report progress to the UI
+        pool.put((yt_dlp.YoutubeDL(ydl_opts), current_job))
+    return pool, progress
+
+
+def can_copy_audio(audio_format, quality):
+    """
+    Check if a downloaded audio stream can be copied into the MP3 as-is.
+    
+    Only MP3 audio at or below the requested bitrate qualifies; any other
+    codec (AAC, Opus, ...) still has to be re-encoded.
+    
+    Args:
+        audio_format: Format dict of the downloaded stream as returned by yt-dlp
+        quality: Audio quality in kbps (128, 192, or 320)
+    
+    Returns:
+        True if the stream can be remuxed without re-encoding
+    """
+    acodec = audio_format.get('acodec') or ''
+    abr = audio_format.get('abr')
+    return acodec.startswith('mp3') and abr is not None and abr <= int(quality)
+
+
+def convert_to_mp3(source, quality, copy_audio=False):
+    """
+    Transcode an audio file to MP3 with ffmpeg, reading the result from its stdout.
+    
+    Args:
+        source: Path object of the downloaded audio file
+        quality: Audio quality in kbps (128, 192, or 320)
+        copy_audio: Copy the audio stream as-is instead of re-encoding it
+    
+    Returns:
+        MP3 audio as bytes
+    
+    Raises:
+        ConversionError: If ffmpeg is missing, fails or times out
+    """
+    command = [
+        'ffmpeg', '-v', 'error',  # Only errors on stderr
+        '-i', str(source),
+        '-vn',  # Drop any video stream
+    ]
+    if copy_audio:
+        # Source is already MP3, only the container needs rewriting
+        command += ['-acodec', 'copy']
+    else:
+        command += [
+            '-acodec', 'libmp3lame',
+            # LAME's default algorithm quality is kept on purpose: the faster
+            # -compression_level settings (7 and up) turn off noise shaping
+            # and audibly lower quality, even at 320kbps
+            '-b:a', f'{quality}k',
+        ]
+    command += ['-f', 'mp3', 'pipe:1']
+    
+    try:
+        result = subprocess.run(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True,
+            timeout=FFMPEG_TIMEOUT
+        )
+    except FileNotFoundError:
+        raise ConversionError("FFmpeg not found. Install FFmpeg and make sure it is on your PATH.") from None
+    except subprocess.TimeoutExpired:
+        raise ConversionError(f"Conversion took longer than {FFMPEG_TIMEOUT // 60} minutes and was stopped.") from None
+    except subprocess.CalledProcessError as e:
+        # Report ffmpeg's last error line, without the server-side path
+        stderr_lines = e.stderr.decode(errors='replace').replace(str(source), source.name).strip().splitlines()
+        detail = stderr_lines[-1] if stderr_lines else f"exit status {e.returncode}"
+        raise ConversionError(f"FFmpeg could not convert the audio: {detail}") from None
+    
+    return result.stdout
+
+
+def describe_error(error):
+    """
+    Turn an exception raised while downloading into a user-friendly message.
+    
+    Args:
+        error: Exception raised by yt-dlp or ffmpeg
+    
+    Returns:
+        Error message string to show to the user
+    """
+    # YoutubeDL wraps the original error, and extractors wrap network errors.
+    # Errors yt-dlp reports itself (e.g. no suitable extractor) wrap nothing.
+    if isinstance(error, DownloadError) and error.exc_info and error.exc_info[1] is not None:
+        error = error.exc_info[1]
+    if isinstance(error, ExtractorError) and isinstance(error.cause, (HTTPError, TransportError)):
+        error = error.cause
+    
+    if isinstance(error, HTTPError) and error.status in HTTP_ERROR_MESSAGES:
+        return HTTP_ERROR_MESSAGES[error.status]
+    
+    for error_type in type(error).__mro__:
+        if error_type in ERROR_MESSAGES:
+            return ERROR_MESSAGES[error_type]
+    
+    # Other extractor errors (e.g. age restriction) carry a readable message
+    error_msg = getattr(error, 'orig_msg', None) or str(error)
+    error_msg = remove_terminal_sequences(error_msg).removeprefix('ERROR: ')
+    return f"❌ Error: {error_msg[:200]}"
+
+
+def download_youtube_audio(info, output_path, quality='192', job_key=None):
+    """
+    Download YouTube video and convert to MP3.
+    
+    Args:
+        info: Info dict already resolved by yt-dlp for this URL
+        output_path: Path object of the folder for temporary source downloads
+        quality: Audio quality in kbps (128, 192, or 320)
+        job_key: Key under which download progress is reported in the pool's progress dict
+    
+    Returns:
+        ConvertResult with the MP3 audio on success
     """
     try:
-        # Create downloads folder if it doesn't exist
-        output_path.mkdir(exist_ok=True)
+        # Reuse the already extracted info instead of resolving the video again
+        video_title = info.get('title', 'video')
         
-        # Configure yt-dlp options with better bot detection avoidance
-        ydl_opts = {
-            'format': 'bestaudio/best',  # Get best audio quality
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',  # Extract audio
-                'preferredcodec': 'mp3',  # Convert to MP3
-                'preferredquality': quality,  # Set quality
-            }],
-            'outtmpl': str(output_path / '%(title)s.%(ext)s'),  # Output template
-            'quiet': False,  # Show progress
-            'no_warnings': False,
-            # Additional options to avoid 403 errors
-            'nocheckcertificate': True,
-            'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'referer': 'https://www.youtube.com/',
-            'extractor_retries': 3,
-            'fragment_retries': 3,
-            'skip_unavailable_fragments': True,
-            # Use cookies if available (helps with 403 errors)
-            'cookiefile': 'cookies.txt' if Path('cookies.txt').exists() else None,
-            # Additional options for restricted videos
-            'age_limit': None,  # Bypass age restrictions if possible
-            'geo_bypass': True,  # Try to bypass geographic restrictions
-            'geo_bypass_country': 'US',  # Pretend to be from US
-            # Optional: Add proxy if needed (uncomment and add your proxy)
-            # 'proxy': 'http://your-proxy-here:port',
-        }
+        # Clean the filename
+        clean_title = clean_filename(video_title)
         
-        # Download and convert
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            # Extract video info first
-            info = ydl.extract_info(url, download=False)
-            video_title = info.get('title', 'video')
+        # Each job downloads into its own temporary folder, so parallel jobs
+        # for the same video or the same title never share a source file.
+        # The folder and anything left in it are removed when the job ends.
+        with tempfile.TemporaryDirectory(dir=output_path) as job_dir:
             
-            # Clean the filename
-            clean_title = clean_filename(video_title)
+            # Download with a cached instance, pointing its output
+            # template at this job's folder
+            ydl_pool, _ = get_ydl_pool(output_path, quality)
+            ydl, current_job = ydl_pool.get()
+            try:
+                current_job['key'] = job_key
+                ydl.params['outtmpl'] = {'default': str(Path(job_dir) / '%(id)s.%(ext)s')}
+                result = ydl.process_ie_result(info, download=True)
+            finally:
+                current_job['key'] = None
+                ydl_pool.put((ydl, current_job))
             
-            # Update output template with cleaned name
-            ydl_opts['outtmpl'] = str(output_path / f'{clean_title}.%(ext)s')
+            # Find the downloaded source audio
+            downloads = result.get('requested_downloads') or [{}]
+            source = Path(downloads[0].get('filepath') or '')
+            copy_audio = can_copy_audio(downloads[0], quality)
             
-            # Download and convert
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl_download:
-                ydl_download.download([url])
+            if not source.is_file():
+                return ConvertResult(False, "File was downloaded but not found in expected location")
             
-            # Find the downloaded file
-            mp3_file = output_path / f"{clean_title}.mp3"
+            # Convert straight into memory
+            audio_bytes = convert_to_mp3(source, quality, copy_audio)
+        
+        return ConvertResult(
+            True,
+            f"Successfully converted: {clean_title}",
+            f"{clean_title}.mp3",
+            audio_bytes,
+            len(audio_bytes)
+        )
             
-            if mp3_file.exists():
-                return True, f"Successfully converted: {clean_title}", str(mp3_file)
-            else:
-                return False, "File was downloaded but not found in expected location", None
-                
     except Exception as e:
-        error_msg = str(e)
-        
         # Provide user-friendly error messages
-        if "Video unavailable" in error_msg or "This video is unavailable" in error_msg:
-            return False, "❌ Error: Video is unavailable, private, or deleted. Try a different video.", None
-        elif "Sign in to confirm your age" in error_msg or "age" in error_msg.lower():
-            return False, "❌ Error: Age-restricted video. Cannot download without authentication.", None
-        elif "This video is not available" in error_msg:
-            return False, "❌ Error: Video not available in this region or on this platform.", None
-        elif "Invalid URL" in error_msg or "Unsupported URL" in error_msg:
-            return False, "❌ Error: Invalid YouTube URL. Make sure it's a valid YouTube link.", None
-        elif "HTTP Error 403" in error_msg or "Forbidden" in error_msg:
-            return False, "❌ Error: Access forbidden. YouTube is blocking this request. Try updating yt-dlp or use a different video.", None
-        elif "HTTP Error 429" in error_msg:
-            return False, "❌ Error: Too many requests. Please wait a few minutes and try again.", None
-        elif "network" in error_msg.lower() or "Connection" in error_msg:
-            return False, "❌ Error: Network connection issue. Check your internet.", None
-        else:
-            return False, f"❌ Error: {error_msg[:200]}", None
+        return ConvertResult(False, describe_error(e))
 
 def main():
     """
@@ -163,11 +430,11 @@ def main():
     col1, col2 = st.columns([3, 1])
     
     with col1:
-        # Input field for YouTube URL
-        youtube_url = st.text_input(
-            "YouTube URL",
+        # Input field for YouTube URLs, one per line
+        youtube_urls = st.text_area(
+            "YouTube URLs",
             placeholder="https://www.youtube.com/watch?v=...",
-            help="Paste the full YouTube video URL here"
+            help="Paste one or more full YouTube video URLs, one per line"
         )
     
     with col2:
@@ -183,91 +450,128 @@ def main():
     # Convert button
     if st.button("🎵 Convert to MP3", type="primary", use_container_width=True):
         
+        # Forget the results of the previous conversion
+        st.session_state.results = []
+        
+        # Split into individual URLs, dropping blank lines and duplicates
+        urls = list(dict.fromkeys(
+            line.strip() for line in youtube_urls.splitlines() if line.strip()
+        ))
+        
         # Validate URL
-        if not youtube_url:
+        if not urls:
             st.error("⚠️ Please enter a YouTube URL")
             return
         
         # Validate YouTube URL format
-        is_valid, validation_msg = validate_youtube_url(youtube_url)
-        if not is_valid:
-            st.error(f"⚠️ {validation_msg}. Please enter a valid YouTube link.")
-            st.info("Example: https://www.youtube.com/watch?v=dQw4w9WgXcQ")
-            return
-        
-        # Create downloads folder path
-        downloads_path = Path("downloads")
+        for youtube_url in urls:
+            is_valid, validation_msg = validate_youtube_url(youtube_url)
+            if not is_valid:
+                st.error(f"⚠️ {validation_msg}: {youtube_url}. Please enter a valid YouTube link.")
+                st.info("Example: https://www.youtube.com/watch?v=dQw4w9WgXcQ")
+                return
         
-        # Show progress
-        with st.spinner("🔄 Checking video availability..."):
-            status_placeholder = st.empty()
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
             
             # First, try to extract info without downloading
-            try:
-                temp_ydl_opts = {
-                    'quiet': True,
-                    'no_warnings': True,
-                    'extract_flat': False,
-                    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                }
+            with st.spinner("🔄 Checking video availability..."):
+                info_futures = [pool.submit(fetch_info, youtube_url) for youtube_url in urls]
+                wait(info_futures)
+            
+            # Failed lookups are kept as results too, so they stay listed
+            # next to the conversions after the script reruns
+            results = {}
+            videos = []
+            for youtube_url, future in zip(urls, info_futures):
+                try:
+                    info = future.result()
+                except Exception as e:
+                    results[youtube_url] = ConvertResult(False, f"{describe_error(e)} ({youtube_url})")
+                    continue
                 
-                with yt_dlp.YoutubeDL(temp_ydl_opts) as ydl:
-                    info = ydl.extract_info(youtube_url, download=False)
-                    if not info:
-                        st.error("❌ Unable to access video. It may be private, deleted, or restricted.")
-                        return
-                    
-                    video_title = info.get('title', 'Unknown')
-                    duration = info.get('duration', 0)
-                    
-                    # Check if video is too long (optional limit)
-                    if duration > 3600:  # 1 hour
-                        st.warning(f"⚠️ Video is {duration//60} minutes long. This may take a while...")
-                    
-                    status_placeholder.success(f"✅ Found: {video_title}")
-                    
-            except Exception as e:
-                st.error(f"❌ Cannot access video: {str(e)[:200]}")
-                st.info("💡 Try a different video or check if it's public and not age-restricted")
-                return
+                if not info:
+                    results[youtube_url] = ConvertResult(
+                        False,
+                        f"❌ Unable to access video. It may be private, deleted, or restricted. ({youtube_url})"
+                    )
+                    continue
+                
+                video_title = info.get('title', 'Unknown')
+                duration = info.get('duration') or 0
+                
+                # Check if video is too long (optional limit)
+                if duration > 3600:  # 1 hour
+                    st.warning(f"⚠️ {video_title} is {duration//60} minutes long. This may take a while...")
+                
+                st.success(f"✅ Found: {video_title}")
+                videos.append((youtube_url, info))
             
-            status_placeholder.info("📥 Starting download and conversion...")
+            if results:
+                st.info("💡 Try a different video or check if it's public and not age-restricted")
             
-            # Perform download and conversion
-            success, message, filepath = download_youtube_audio(
-                youtube_url, 
-                downloads_path, 
-                quality
-            )
+            if videos:
+                # Perform downloads and conversions in parallel, one progress bar per video
+                downloads_path = get_downloads_dir()
+                _, download_progress = get_ydl_pool(downloads_path, quality)
+                progress_bars = {
+                    youtube_url: st.progress(0.0, text=f"📥 {info.get('title', 'Unknown')}")
+                    for youtube_url, info in videos
+                }
+                futures = {}
+                for youtube_url, info in videos:
+                    # Unique per job, so jobs for the same video never share progress
+                    job_key = uuid.uuid4().hex
+                    future = pool.submit(download_youtube_audio, info, downloads_path, quality, job_key)
+                    futures[future] = (youtube_url, info, job_key)
+                pending = set(futures)
+                while pending:
+                    done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                    
+                    for future in done:
+                        youtube_url, info, job_key = futures[future]
+                        results[youtube_url] = future.result()
+                        download_progress.pop(job_key, None)
+                        progress_bars[youtube_url].progress(1.0, text=f"✅ {info.get('title', 'Unknown')}")
+                    
+                    for future in pending:
+                        youtube_url, info, job_key = futures[future]
+                        fraction = download_progress.get(job_key, 0.0)
+                        if fraction < 1.0:
+                            text = f"📥 Downloading {info.get('title', 'Unknown')}"
+                        else:
+                            text = f"🔄 Converting {info.get('title', 'Unknown')}"
+                        progress_bars[youtube_url].progress(fraction, text=text)
         
-        # Show result
-        if success:
-            st.success(f"✅ {message}")
-            
-            # Read the file for download
-            with open(filepath, 'rb') as f:
-                audio_bytes = f.read()
-            
-            # Get just the filename
-            filename = Path(filepath).name
+        # Keep results in the order the URLs were entered. They live in
+        # session state because clicking a download button reruns the
+        # script, and the other files must still be downloadable after that.
+        st.session_state.results = [(youtube_url, results[youtube_url]) for youtube_url in urls]
+        
+        if any(result.success for _, result in st.session_state.results):
+            st.balloons()  # Celebration animation!
+    
+    # Show results of the last conversion
+    for youtube_url, result in st.session_state.get('results', []):
+        
+        if result.success:
+            st.success(f"✅ {result.message}")
             
             # Create download button
             st.download_button(
-                label="⬇️ Download MP3",
-                data=audio_bytes,
-                file_name=filename,
+                label=f"⬇️ Download {result.filename}",
+                data=result.audio_bytes,
+                file_name=result.filename,
                 mime="audio/mpeg",
+                key=f"download_{youtube_url}",
                 use_container_width=True
             )
             
-            st.balloons()  # Celebration animation!
-            
             # Show file info
-            file_size = len(audio_bytes) / (1024 * 1024)  # Convert to MB
+            file_size = result.size / (1024 * 1024)  # Convert to MB
             st.info(f"📊 File size: {file_size:.2f} MB")
             
         else:
-            st.error(message)
+            st.error(result.message)
     
     # Instructions section
     st.markdown("---")
@@ -275,7 +579,7 @@ def main():
         st.markdown("""
         **Steps:**
         1. Copy a YouTube video URL
-        2. Paste it in the text box above
+        2. Paste it in the text box above (one URL per line to convert several at once)
         3. Select your preferred audio quality
         4. Click "Convert to MP3"
         5. Wait for the conversion to complete
@@ -294,7 +598,7 @@ def main():
         - **"Invalid URL"**: Make sure you copied the complete YouTube URL
         - **"Video unavailable"**: Video might be private or deleted
         - **"Network error"**: Check your internet connection
-        - **"FFmpeg not found"**: Run `pip install yt-dlp` again
+        - **"FFmpeg not found"**: Install FFmpeg and make sure it is on your PATH
         
         **Supported URLs:**
         - https://www.youtube.com/watch?v=...